@@ -1,6 +1,20 @@
+import codecs
 import json
+import mmap
+import os
 from enum import Enum
-from typing import Dict, List, Tuple, Optional
+from typing import IO, Any, Callable, Dict, Iterable, KeysView, List, Tuple, Optional, Union
+
+try:
+    import orjson  # 可选依赖，安装后用于加速JSON解析
+except ImportError:
+    orjson = None
+
+# 检测LANG格式时优先检查的文件开头长度（字符数）
+_DETECT_HEAD_SIZE = 4096
+
+# 逐行读取文件时使用的缓冲区大小
+_READ_BUFFER_SIZE = 1 << 20
 
 class LangFormat(Enum):
     """
@@ -15,38 +29,51 @@ class LangFormat(Enum):
 
 class TextElement:
     """
-    表示单个翻译条目
+    表示单个翻译条目，是ModDictionary中某一条目的轻量视图
+    
+    条目数据保存在ModDictionary的并列数组中，本类只记录所属字典、键和条目下标，
+    读写属性时直接访问字典中的数组
     
     属性:
         key (str): 翻译项的键
         original_text (str): 原文内容
         translated_text (str): 译文内容
-        _changed (bool): 标记是否被修改过
     """
     
-    def __init__(self, key: str, original_text: str, translated_text: str = ""):
+    __slots__ = ("_dictionary", "key", "_index")
+
+    def __init__(self, dictionary: "ModDictionary", key: str, index: int):
         """
-        初始化翻译条目
+        初始化翻译条目视图
         
         参数:
+            dictionary: 条目所属的模组字典
             key: 翻译项的键
-            original_text: 原文内容
-            translated_text: 译文内容（默认为空）
+            index: 条目在字典数组中的下标
         """
+        self._dictionary = dictionary
         self.key = key
-        self.original_text = original_text
-        self.translated_text = translated_text
-        self._changed = False  # 标记是否被修改过
+        self._index = index
+
+    @property
+    def original_text(self) -> str:
+        """原文内容"""
+        return self._dictionary._originals[self._index]
+
+    @property
+    def translated_text(self) -> str:
+        """译文内容"""
+        return self._dictionary._translations[self._index]
 
     @property
     def is_translated(self) -> bool:
         """检查条目是否已翻译"""
-        return bool(self.translated_text.strip())
+        return bool(self._dictionary._translated[self._index])
 
     @property
     def is_changed(self) -> bool:
         """检查条目是否被修改过"""
-        return self._changed
+        return bool(self._dictionary._changed[self._index])
 
     def set_translated_text(self, text: str) -> None:
         """
@@ -55,25 +82,49 @@ class TextElement:
         参数:
             text: 要设置的译文文本
         """
-        if text != self.translated_text:
-            self.translated_text = text
-            self._changed = True  # 标记为已修改
+        self._dictionary._set_translation(self._index, text)
 
     def reset(self) -> None:
         """重置译文内容"""
-        self.translated_text = ""
-        self._changed = False  # 重置修改标记
+        self._dictionary._reset_translation(self._index)
 
     def __str__(self) -> str:
         """返回译文（如果已翻译）或原文（如果未翻译）"""
-        return self.translated_text if self.is_translated else self.original_text
+        return self._dictionary._display[self._index]
 
 
 class LangFileParser:
     """语言文件解析器，支持.lang和.json格式"""
     
     @staticmethod
-    def detect_format(text: str) -> LangFormat:
+    def _json_loads(data: Union[str, bytes, memoryview]) -> Any:
+        """
+        解析JSON文本，安装了orjson时优先使用orjson
+        
+        orjson比json严格（不接受NaN、超出范围的数字、转义的孤立代理字符等），
+        orjson解析失败时再用json解析一次，可接受的内容与json.loads相同
+        
+        参数:
+            data: JSON文本，或UTF-8编码的字节（不含BOM）
+            
+        返回:
+            Any: 解析得到的Python对象
+            
+        异常:
+            json.JSONDecodeError: 如果JSON无效
+            UnicodeDecodeError: 如果字节不是有效的UTF-8文本
+        """
+        if orjson is not None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass  # 交给json重新解析
+        if not isinstance(data, str):
+            data = str(data, "utf-8")
+        return json.loads(data)
+
+    @staticmethod
+    def detect_format(text: str) -> Tuple[LangFormat, Optional[Dict[str, Any]]]:
         """
         自动检测语言文件格式
         
@@ -81,48 +132,95 @@ class LangFileParser:
             text: 文件内容文本
             
         返回:
-            LangFormat: 检测到的文件格式
+            Tuple[LangFormat, Optional[Dict[str, Any]]]: (检测到的文件格式, 已解析的JSON对象)
+            JSON格式会一并返回解析结果供parse复用，LANG格式该项为None
             
         异常:
             ValueError: 如果无法识别文件格式
         """
-        # 清理文本，移除BOM标记和空白字符
-        text = text.lstrip("\ufeff").strip()
-        if not text:
+        # 跳过开头的BOM标记和空白字符，只移动下标而不复制整个文本
+        length = len(text)
+        start = 0
+        while start < length and text[start] == "\ufeff":
+            start += 1
+        bom_end = start
+        while start < length and text[start].isspace():
+            start += 1
+        if start == length:
             raise ValueError("文件内容为空")
+        end = length
+        while text[end - 1].isspace():
+            end -= 1
 
-        # 尝试解析为JSON
-        try:
-            json_data = json.loads(text)
-            # 检查是否是键值对格式
-            if isinstance(json_data, dict) and all(isinstance(v, str) for v in json_data.values()):
-                return LangFormat.JSON
-        except json.JSONDecodeError:
-            pass  # 不是JSON格式，继续尝试其他格式
-
-        # 检查是否是LANG格式
-        lines = text.split("\n")
-        for line in lines:
-            line = line.strip()
-            if line and not line.startswith("#") and not line.startswith("//"):
-                if "=" in line:
-                    key, value = line.split("=", 1)
-                    if key.strip() and value.strip():
-                        return LangFormat.LANG
+        # 只有以"{"开头时才可能是JSON键值对格式，其他内容直接按LANG格式检测
+        if text[start] == "{":
+            # JSON解析器不接受BOM和非ASCII空白字符，只有存在这些字符时才复制出去除首尾后的文本
+            padding = text[bom_end:start] + text[end:]
+            json_text = text if not bom_end and not padding.strip(" \t\r\n") else text[start:end]
+            try:
+                json_data = LangFileParser._json_loads(json_text)
+                # 检查是否是键值对格式
+                if LangFileParser._is_json_lang(json_data):
+                    return LangFormat.JSON, json_data
+            except json.JSONDecodeError:
+                pass  # 不是JSON格式，继续尝试其他格式
+
+        # 检查是否是LANG格式，先只查看文件开头，找不到时再扫描全文
+        head_end = start + _DETECT_HEAD_SIZE
+        if LangFileParser._has_lang_entry(text[start:head_end]) or (
+            head_end < end and LangFileParser._has_lang_entry(text[start:] if start else text)
+        ):
+            return LangFormat.LANG, None
 
         raise ValueError("无法识别的语言文件格式，请确保文件是有效的语言文件")
 
     @staticmethod
-    def parse(text: str, format: LangFormat) -> Tuple[Dict[str, str], List[str]]:
+    def _is_json_lang(json_data: Any) -> bool:
         """
-        解析语言文件，返回键值字典和保持原始顺序的键列表
+        检查解析得到的JSON对象是否是语言文件的键值对格式
+        
+        参数:
+            json_data: 已解析的JSON对象
+            
+        返回:
+            bool: 是值全部为字符串的字典时为True
+        """
+        return isinstance(json_data, dict) and all(isinstance(v, str) for v in json_data.values())
+
+    @staticmethod
+    def _has_lang_entry(text: str) -> bool:
+        """
+        检查文本中是否存在有效的LANG键值对
+        
+        参数:
+            text: 要检查的文本
+            
+        返回:
+            bool: 存在至少一个"键=值"条目时为True
+        """
+        for line in text.split("\n"):
+            line = line.strip()
+            if not line or line.startswith(("#", "//")):
+                continue
+            key, separator, value = line.partition("=")
+            if separator and key.strip() and value.strip():
+                return True
+        return False
+
+    @staticmethod
+    def parse(
+        text: str, format: LangFormat, parsed: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, str]:
+        """
+        解析语言文件，返回按原始顺序排列的键值字典
         
         参数:
             text: 文件内容文本
             format: 文件格式
+            parsed: detect_format返回的已解析JSON对象（可选），提供时不再重复解析
             
         返回:
-            Tuple[Dict[str, str], List[str]]: (键值字典, 保持原始顺序的键列表)
+            Dict[str, str]: 键值字典（插入顺序即键的原始顺序）
             
         异常:
             ValueError: 如果解析失败或未找到有效条目
@@ -130,12 +228,33 @@ class LangFileParser:
         if format == LangFormat.LANG:
             return LangFileParser._parse_lang(text)
         elif format == LangFormat.JSON:
-            return LangFileParser._parse_json(text)
+            return LangFileParser._parse_json(text, parsed)
+        else:
+            raise ValueError(f"不支持的格式: {format}")
+
+    @staticmethod
+    def get_parser(format: LangFormat) -> Callable[[str], Dict[str, str]]:
+        """
+        获取指定格式的解析函数，供需要反复解析同一格式的调用方预先取得
+        
+        参数:
+            format: 文件格式
+            
+        返回:
+            Callable[[str], Dict[str, str]]: 接受文件内容文本的解析函数
+            
+        异常:
+            ValueError: 如果格式不支持
+        """
+        if format == LangFormat.LANG:
+            return LangFileParser._parse_lang
+        elif format == LangFormat.JSON:
+            return LangFileParser._parse_json
         else:
             raise ValueError(f"不支持的格式: {format}")
 
     @staticmethod
-    def _parse_lang(text: str) -> Tuple[Dict[str, str], List[str]]:
+    def _parse_lang(text: str) -> Dict[str, str]:
         """
         解析.lang格式文件
         
@@ -143,73 +262,187 @@ class LangFileParser:
             text: 文件内容文本
             
         返回:
-            Tuple[Dict[str, str], List[str]]: (键值字典, 保持原始顺序的键列表)
+            Dict[str, str]: 键值字典（插入顺序即键的原始顺序）
+            
+        异常:
+            ValueError: 如果未找到有效的翻译条目
+        """
+        return LangFileParser._parse_lang_lines(text.split("\n"))
+
+    @staticmethod
+    def _parse_lang_lines(lines: Iterable[str]) -> Dict[str, str]:
+        """
+        逐行解析.lang格式内容，可直接传入以文本模式打开的文件对象
+        
+        参数:
+            lines: 文件内容的各行
+            
+        返回:
+            Dict[str, str]: 键值字典（插入顺序即键的原始顺序）
             
         异常:
             ValueError: 如果未找到有效的翻译条目
         """
         result = {}
-        keys = []  # 保持键的原始顺序
 
-        for line in text.split("\n"):
+        for line in lines:
             line = line.strip()
             # 跳过空行和注释
-            if not line or line.startswith("#") or line.startswith("//"):
+            if not line or line.startswith(("#", "//")):
                 continue
 
-            # 查找键值分隔符
-            separator_index = line.find("=")
-            if separator_index == -1:
+            # 按第一个等号拆分键和值
+            key, separator, value = line.partition("=")
+            if not separator:
                 continue  # 没有等号的行跳过
 
-            # 提取键和值
-            key = line[:separator_index].strip()
-            value = line[separator_index + 1 :].strip()
+            # 整行已去除两端空白，键只需去除右侧、值只需去除左侧
+            key = key.rstrip()
+            value = value.lstrip()
 
             # 确保键和值都不为空
             if key and value:
                 # 避免重复键
                 if key not in result:
-                    keys.append(key)
                     result[key] = value
 
         if not result:
             raise ValueError("未找到有效的翻译条目")
 
-        return result, keys
+        return result
 
     @staticmethod
-    def _parse_json(text: str) -> Tuple[Dict[str, str], List[str]]:
+    def _parse_json(text: str, parsed: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
         """
         解析JSON格式文件
         
         参数:
             text: 文件内容文本
+            parsed: 已解析的JSON对象（可选），提供时直接使用
             
         返回:
-            Tuple[Dict[str, str], List[str]]: (键值字典, 保持原始顺序的键列表)
+            Dict[str, str]: 键值字典（插入顺序即键的原始顺序）
             
         异常:
             ValueError: 如果JSON无效或未找到有效的翻译条目
         """
-        result = {}
-        keys = []  # 保持键的原始顺序
+        if parsed is not None:
+            # detect_format已确认所有值都是字符串，无需再逐项筛选
+            return LangFileParser._checked_json_entries(parsed)
 
         try:
-            json_data = json.loads(text)
-            for key, value in json_data.items():
-                # 只处理字符串值
-                if isinstance(value, str):
-                    keys.append(key)
-                    result[key] = value
-
-            if not result:
-                raise ValueError("未找到有效的翻译条目")
-
-            return result, keys
+            json_data = LangFileParser._json_loads(text)
         except json.JSONDecodeError as e:
             raise ValueError(f"JSON格式无效: {str(e)}") from e
 
+        return LangFileParser._collect_json_entries(json_data)
+
+    @staticmethod
+    def _collect_json_entries(json_data: Dict[str, Any]) -> Dict[str, str]:
+        """
+        从已解析的JSON对象中提取翻译条目
+        
+        参数:
+            json_data: 已解析的JSON对象
+            
+        返回:
+            Dict[str, str]: 键值字典（插入顺序即键的原始顺序）
+            
+        异常:
+            ValueError: 如果未找到有效的翻译条目
+        """
+        # 只处理字符串值
+        return LangFileParser._checked_json_entries(
+            {key: value for key, value in json_data.items() if isinstance(value, str)}
+        )
+
+    @staticmethod
+    def _checked_json_entries(json_data: Dict[str, str]) -> Dict[str, str]:
+        """
+        确认已通过_is_json_lang检查的JSON对象中有翻译条目，直接作为结果返回
+        
+        参数:
+            json_data: 值全部为字符串的JSON对象
+            
+        返回:
+            Dict[str, str]: 键值字典（插入顺序即键的原始顺序）
+            
+        异常:
+            ValueError: 如果未找到有效的翻译条目
+        """
+        if not json_data:
+            raise ValueError("未找到有效的翻译条目")
+
+        return json_data
+
+    @staticmethod
+    def parse_path(
+        path: Union[str, "os.PathLike[str]"], format: Optional[LangFormat] = None
+    ) -> Tuple[LangFormat, Dict[str, str]]:
+        """
+        通过内存映射从磁盘解析语言文件，未指定格式时自动检测格式
+        
+        安装了orjson时，JSON文件直接从映射的字节解析，不会先把整个文件解码成Python字符串；
+        指定为LANG格式时逐行读取文件解析
+        
+        参数:
+            path: 文件路径
+            format: 文件格式（可选），指定时不再检测，按该格式解析
+            
+        返回:
+            Tuple[LangFormat, Dict[str, str]]: (文件格式, 按原始顺序排列的键值字典)
+            
+        异常:
+            ValueError: 如果文件为空、不是有效的UTF-8文本、无法识别格式或未找到有效条目
+            OSError: 如果文件无法打开
+        """
+        if format == LangFormat.LANG:
+            # 已知是LANG格式时逐行读取解析，不把整个文件读成一个字符串再拆分
+            with open(path, "r", encoding="utf-8-sig", buffering=_READ_BUFFER_SIZE) as file:
+                return format, LangFileParser._parse_lang_lines(file)
+
+        with open(path, "rb") as file:
+            # 空文件无法进行内存映射
+            if os.fstat(file.fileno()).st_size == 0:
+                raise ValueError("文件内容为空")
+
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                # 跳过BOM标记，只移动起始位置而不复制内容
+                start = len(codecs.BOM_UTF8) if mapped[:3] == codecs.BOM_UTF8 else 0
+                with memoryview(mapped) as view, view[start:] as data:
+                    if orjson is not None and format == LangFormat.JSON:
+                        try:
+                            json_data = LangFileParser._json_loads(data)
+                        except json.JSONDecodeError as e:
+                            raise ValueError(f"JSON格式无效: {str(e)}") from e
+                        return format, LangFileParser._collect_json_entries(json_data)
+
+                    if orjson is not None and format is None:
+                        # 跳过开头的ASCII空白，只有以"{"开头时才直接从字节解析JSON，
+                        # 避免.lang文件在json回退解析时被多解码一次
+                        first = start
+                        while mapped[first:first + 1] in (b" ", b"\t", b"\r", b"\n"):
+                            first += 1
+                        if mapped[first:first + 1] == b"{":
+                            try:
+                                json_data = LangFileParser._json_loads(data)
+                            except json.JSONDecodeError:
+                                json_data = None  # 不是JSON格式，按文本继续检测
+                            if LangFileParser._is_json_lang(json_data):
+                                return LangFormat.JSON, LangFileParser._checked_json_entries(json_data)
+
+                    text = str(data, "utf-8")
+
+        # 与文本模式读取一致，把\r\n和单独的\r统一换成\n
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+
+        if format is not None:
+            return format, LangFileParser.parse(text, format)
+
+        format, parsed = LangFileParser.detect_format(text)
+        return format, LangFileParser.parse(text, format, parsed)
+
     @staticmethod
     def generate_output(data: Dict[str, str], format: LangFormat, keys: Optional[List[str]] = None) -> str:
         """
@@ -226,36 +459,137 @@ class LangFileParser:
         异常:
             ValueError: 如果格式不支持
         """
-        if format == LangFormat.LANG:
-            # LANG格式：键=值，每行一个
-            lines = []
-            for key in keys or data.keys():
-                if key in data:
-                    lines.append(f"{key}={data[key]}")
-            return "\n".join(lines)
+        emit = LangFileParser.get_emitter(format)
+        if keys:
+            # 按指定的键顺序重新排列，忽略字典中不存在的键
+            return emit((key, data[key]) for key in keys if key in data)
+        return emit(data.items())
+
+    @staticmethod
+    def get_emitter(format: LangFormat) -> Callable[[Iterable[Tuple[str, str]]], str]:
+        """
+        获取指定格式的输出生成函数，供需要反复导出同一格式的调用方预先取得
         
+        参数:
+            format: 输出格式
+            
+        返回:
+            Callable[[Iterable[Tuple[str, str]]], str]: 接受按输出顺序排列的键值对、返回输出文本的函数
+            
+        异常:
+            ValueError: 如果格式不支持
+        """
+        if format == LangFormat.LANG:
+            return LangFileParser._emit_lang
         elif format == LangFormat.JSON:
-            # JSON格式：保持键的顺序
-            if keys:
-                # 保持原始键的顺序
-                ordered_dict = {key: data[key] for key in keys if key in data}
-                return json.dumps(ordered_dict, ensure_ascii=False, indent=4)
+            return LangFileParser._emit_json
+        else:
+            raise ValueError(f"不支持的格式: {format}")
+
+    @staticmethod
+    def _emit_lang(pairs: Iterable[Tuple[str, str]]) -> str:
+        """
+        生成LANG格式内容：键=值，每行一个
+        
+        参数:
+            pairs: 按输出顺序排列的键值对
+            
+        返回:
+            str: 生成的输出文本
+        """
+        return "\n".join([f"{key}={value}" for key, value in pairs])
+
+    @staticmethod
+    def _emit_json(pairs: Iterable[Tuple[str, str]]) -> str:
+        """
+        生成JSON格式内容，保持字典中键的顺序
+        
+        安装了orjson时优先使用orjson，输出与json.dumps(ensure_ascii=False, indent=4)相同
+        
+        参数:
+            pairs: 按输出顺序排列的键值对
+            
+        返回:
+            str: 生成的输出文本
+        """
+        data = dict(pairs)
+        if orjson is not None:
+            try:
+                content = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+            except orjson.JSONEncodeError:
+                pass  # 含有孤立代理字符等orjson不接受的文本时交给json处理
             else:
-                return json.dumps(data, ensure_ascii=False, indent=4)
+                # orjson只支持2空格缩进；扁平的键值对象每个条目占一行，
+                # 字符串中的换行都已转义，只需把条目行首的缩进换成4空格
+                return content.replace('\n  "', '\n    "')
+        return json.dumps(data, ensure_ascii=False, indent=4)
+
+    @staticmethod
+    def get_writer(format: LangFormat) -> Callable[[IO[str], Iterable[Tuple[str, str]]], None]:
+        """
+        获取指定格式的流式写出函数，逐条写入文件对象而不先拼出完整文本
         
+        参数:
+            format: 输出格式
+            
+        返回:
+            Callable[[IO[str], Iterable[Tuple[str, str]]], None]: 接受文本文件对象和按输出顺序排列的键值对的函数，
+            写出的内容与get_emitter生成的文本一致
+            
+        异常:
+            ValueError: 如果格式不支持
+        """
+        if format == LangFormat.LANG:
+            return LangFileParser._write_lang
+        elif format == LangFormat.JSON:
+            return LangFileParser._write_json
         else:
             raise ValueError(f"不支持的格式: {format}")
 
+    @staticmethod
+    def _write_lang(file: IO[str], pairs: Iterable[Tuple[str, str]]) -> None:
+        """
+        流式写出LANG格式内容：键=值，每行一个
+        
+        参数:
+            file: 文本文件对象
+            pairs: 按输出顺序排列的键值对
+        """
+        pairs = iter(pairs)
+        for key, value in pairs:
+            file.write(f"{key}={value}")
+            break
+        file.writelines(f"\n{key}={value}" for key, value in pairs)
+
+    @staticmethod
+    def _write_json(file: IO[str], pairs: Iterable[Tuple[str, str]]) -> None:
+        """
+        流式写出JSON格式内容，格式与json.dumps(ensure_ascii=False, indent=4)相同
+        
+        参数:
+            file: 文本文件对象
+            pairs: 按输出顺序排列的键值对
+        """
+        encode = json.encoder.encode_basestring
+        separator = "{\n    "
+        for key, value in pairs:
+            file.write(f"{separator}{encode(key)}: {encode(value)}")
+            separator = ",\n    "
+        # 没有任何条目时与json.dumps一样输出{}
+        file.write("{}" if separator == "{\n    " else "\n}")
+
 
 class ModDictionary:
     """
     模组翻译字典管理
     
+    条目数据按列保存在并列数组中（原文、译文、修改标记等各一个数组，
+    下标相同的元素属于同一条目），键到下标的字典按插入顺序保存键的原始顺序，
+    TextElement视图在访问时才创建
+    
     属性:
         mod_namespace (str): 模组命名空间
         format (LangFormat): 文件格式
-        text_dictionary (Dict[str, TextElement]): 翻译条目字典
-        keys (List[str]): 保持原始顺序的键列表
     """
     
     def __init__(self, mod_namespace: str):
@@ -267,64 +601,305 @@ class ModDictionary:
         """
         self.mod_namespace = mod_namespace
         self.format: Optional[LangFormat] = None
-        self.text_dictionary: Dict[str, TextElement] = {}
-        self.keys: List[str] = []
+        self._index: Dict[str, int] = {}       # 键 -> 条目下标，插入顺序即键的原始顺序
+        self._originals: List[str] = []        # 原文数组
+        self._translations: List[str] = []     # 译文数组
+        self._display: List[str] = []          # 最终输出文本数组：已翻译为译文，否则为原文
+        self._translated = bytearray()         # 翻译标记数组，1表示译文非空白
+        self._changed = bytearray()            # 修改标记数组，1表示被修改过
+        self._translated_count = 0             # 已翻译条目数，随翻译标记同步更新
+        # 当前格式的解析函数，加载原始文件时确定
+        self._parse_fn: Optional[Callable[[str], Dict[str, str]]] = None
+        # 当前格式的输出生成函数，加载原始文件时确定
+        self._emit_fn: Optional[Callable[[Iterable[Tuple[str, str]]], str]] = None
+        # 最近一次解析的翻译文件：(文件内容, 解析结果)，重复加载同一文件时直接复用
+        self._translated_cache: Optional[Tuple[Union[str, Tuple[str, int, int]], Dict[str, str]]] = None
+        # 数据版本号，每次条目内容变化时递增，用于判断导出缓存是否有效
+        self._version = 0
+        # 最近一次导出的结果：(数据版本号, 导出格式, 导出内容)
+        self._export_cache: Optional[Tuple[int, LangFormat, str]] = None
 
-    def load_original_file(self, text: str) -> None:
+    def load_original_file(self, source: Union[str, "os.PathLike[str]"]) -> None:
         """
         加载原始语言文件
         
         参数:
-            text: 文件内容文本
+            source: 文件内容文本，或文件路径（os.PathLike对象，如pathlib.Path）
             
         异常:
             ValueError: 如果加载失败
+            OSError: 如果文件无法读取
+            UnicodeDecodeError: 如果文件不是有效的UTF-8文本
         """
         try:
-            # 检测文件格式
-            self.format = LangFileParser.detect_format(text)
-            
-            # 解析文件内容
-            result, self.keys = LangFileParser.parse(text, self.format)
+            if isinstance(source, os.PathLike):
+                # 文件路径：通过内存映射直接从磁盘解析
+                self.format, result = LangFileParser.parse_path(source)
+            else:
+                # 检测文件格式
+                self.format, parsed = LangFileParser.detect_format(source)
+                
+                # 解析文件内容，JSON格式直接复用检测时的解析结果
+                result = LangFileParser.parse(source, self.format, parsed)
             if not result:
                 raise ValueError("未找到有效的翻译条目")
             
-            # 清空现有字典并加载新条目
-            self.text_dictionary.clear()
-            for key in self.keys:
-                self.text_dictionary[key] = TextElement(key, result[key])
+            # 用新条目替换现有数组，字典的插入顺序即键的原始顺序
+            count = len(result)
+            self._index = dict(zip(result, range(count)))
+            self._originals = list(result.values())
+            self._translations = [""] * count
+            self._display = self._originals.copy()
+            self._translated = bytearray(count)
+            self._changed = bytearray(count)
+            self._translated_count = 0
+            self._parse_fn = LangFileParser.get_parser(self.format)
+            self._emit_fn = LangFileParser.get_emitter(self.format)
+            self._translated_cache = None
+            self._version += 1
         
+        except (OSError, UnicodeDecodeError):
+            raise  # 读取文件本身的错误原样抛出，由调用方说明是哪一步失败
         except Exception as e:
             raise ValueError(f"加载文件失败: {str(e)}") from e
 
-    def load_translated_file(self, text: str) -> None:
+    def load_translated_file(self, source: Union[str, "os.PathLike[str]"]) -> None:
         """
         加载已翻译的语言文件
         
         参数:
-            text: 文件内容文本
+            source: 文件内容文本，或文件路径（os.PathLike对象，如pathlib.Path）
             
         异常:
             ValueError: 如果加载失败或原始文件未加载
+            OSError: 如果文件无法读取
+            UnicodeDecodeError: 如果文件不是有效的UTF-8文本
         """
-        if not self.text_dictionary:
+        if not self._index:
             raise ValueError("必须先加载原始文本才能加载翻译")
         
-        if not self.format:
+        if not self.format or not self._parse_fn:
             raise ValueError("未知的文件格式")
         
         try:
-            # 解析翻译文件
-            result, _ = LangFileParser.parse(text, self.format)
+            # 文件路径以(路径, 修改时间, 大小)作为缓存键，文件未改动时视为内容相同
+            if isinstance(source, os.PathLike):
+                stat = os.stat(source)
+                cache_key = (os.fspath(source), stat.st_mtime_ns, stat.st_size)
+            else:
+                cache_key = source
+            
+            # 解析翻译文件，内容与上次加载的相同时复用上次的解析结果
+            if self._translated_cache is not None and self._translated_cache[0] == cache_key:
+                result = self._translated_cache[1]
+            else:
+                if isinstance(source, os.PathLike):
+                    # 文件路径：通过内存映射直接按原始文件的格式解析
+                    _, result = LangFileParser.parse_path(source, self.format)
+                else:
+                    result = self._parse_fn(source)
+                self._translated_cache = (cache_key, result)
             
-            # 更新翻译条目
-            for key, value in result.items():
-                if key in self.text_dictionary:
-                    self.text_dictionary[key].set_translated_text(value)
+            # 批量更新翻译条目
+            self.bulk_set_translations(result)
         
+        except (OSError, UnicodeDecodeError):
+            raise  # 读取文件本身的错误原样抛出，由调用方说明是哪一步失败
         except Exception as e:
             raise ValueError(f"加载翻译文件失败: {str(e)}") from e
 
+    def get(self, key: str) -> Optional[TextElement]:
+        """
+        获取指定键的翻译条目
+        
+        参数:
+            key: 翻译项的键
+            
+        返回:
+            Optional[TextElement]: 翻译条目视图，键不存在时为None
+        """
+        index = self._index.get(key)
+        return TextElement(self, key, index) if index is not None else None
+
+    def index_of(self, key: str) -> Optional[int]:
+        """
+        获取指定键在原始顺序中的位置
+        
+        参数:
+            key: 翻译项的键
+            
+        返回:
+            Optional[int]: 条目下标（与keys()的键顺序一致），键不存在时为None
+        """
+        return self._index.get(key)
+
+    def find_untranslated(self, start: int = 0, end: Optional[int] = None) -> Optional[int]:
+        """
+        在指定下标范围内查找第一个未翻译的条目
+        
+        参数:
+            start: 起始下标（包含）
+            end: 结束下标（不包含），为None时查找到末尾
+            
+        返回:
+            Optional[int]: 条目下标（与keys()的键顺序一致），范围内全部已翻译时为None
+        """
+        # 翻译标记保存在bytearray中，直接查找值为0的字节
+        index = self._translated.find(0, start, end)
+        return index if index != -1 else None
+
+    def is_translated_at(self, index: int) -> bool:
+        """
+        检查指定下标的条目是否已翻译，不创建条目视图
+        
+        参数:
+            index: 条目下标（与keys()的键顺序一致）
+            
+        返回:
+            bool: 条目已翻译时为True
+        """
+        return bool(self._translated[index])
+
+    @property
+    def translated_count(self) -> int:
+        """已翻译的条目数"""
+        return self._translated_count
+
+    def keys(self) -> KeysView[str]:
+        """
+        获取所有翻译项的键
+        
+        返回:
+            KeysView[str]: 按原始顺序排列的键视图，支持len、遍历和in判断
+        """
+        return self._index.keys()
+
+    def set_translated_text(self, key: str, text: str) -> None:
+        """
+        设置指定键的译文内容
+        
+        参数:
+            key: 翻译项的键
+            text: 要设置的译文文本
+            
+        异常:
+            KeyError: 如果键不存在
+        """
+        self._set_translation(self._index[key], text)
+
+    def bulk_set_translations(self, translations: Dict[str, str], mark_changed: bool = True) -> None:
+        """
+        批量设置译文，原始文件中不存在的键会被忽略
+        
+        与逐条调用set_translated_text的结果相同，但在一个循环内直接写入数组，
+        省去每个条目的方法调用
+        
+        参数:
+            translations: 键到译文的字典
+            mark_changed: 是否把内容有变化的条目标记为已修改（默认为True）
+        """
+        index_of = self._index.get
+        originals = self._originals
+        translations_array = self._translations
+        display = self._display
+        translated = self._translated
+        changed = self._changed
+        delta = 0
+
+        for key, text in translations.items():
+            index = index_of(key)
+            if index is None or text == translations_array[index]:
+                continue
+            is_translated = bool(text.strip())
+            delta += is_translated - translated[index]
+            translations_array[index] = text
+            display[index] = text if is_translated else originals[index]
+            translated[index] = is_translated
+            if mark_changed:
+                changed[index] = 1
+
+        self._translated_count += delta
+        self._version += 1
+
+    def clear_duplicate_translations(self) -> int:
+        """
+        清空与原文相同的译文，效果与对这些条目逐个调用TextElement.reset相同
+        
+        返回:
+            int: 被清空的条目数
+        """
+        originals = self._originals
+        translations = self._translations
+        translated = self._translated
+        indices = [
+            index for index, is_translated in enumerate(translated)
+            if is_translated and originals[index] == translations[index]
+        ]
+
+        display = self._display
+        changed = self._changed
+        for index in indices:
+            translations[index] = ""
+            display[index] = originals[index]
+            translated[index] = 0
+            changed[index] = 0
+
+        self._translated_count -= len(indices)
+        self._version += 1
+        return len(indices)
+
+    def fill_empty_translations(self) -> int:
+        """
+        用原文填充所有未翻译条目的译文，效果与对这些条目逐个调用set_translated_text相同
+        
+        返回:
+            int: 填充前未翻译的条目数
+        """
+        originals = self._originals
+        translations = self._translations
+        translated = self._translated
+        indices = [index for index, is_translated in enumerate(translated) if not is_translated]
+
+        display = self._display
+        changed = self._changed
+        delta = 0
+        for index in indices:
+            text = originals[index]
+            if text == translations[index]:
+                continue
+            # 原文为空白时填充后仍视为未翻译
+            is_translated = bool(text.strip())
+            delta += is_translated
+            translations[index] = text
+            display[index] = text  # 译文与原文相同，两种情况下都显示原文
+            translated[index] = is_translated
+            changed[index] = 1
+
+        self._translated_count += delta
+        self._version += 1
+        return len(indices)
+
+    def _set_translation(self, index: int, text: str) -> None:
+        """设置指定下标条目的译文，内容变化时标记为已修改"""
+        if text != self._translations[index]:
+            # 只在写入时判断一次译文是否为空白，读取翻译状态时不再strip
+            is_translated = bool(text.strip())
+            self._translated_count += is_translated - self._translated[index]
+            self._translations[index] = text
+            self._display[index] = text if is_translated else self._originals[index]
+            self._translated[index] = is_translated
+            self._changed[index] = 1  # 标记为已修改
+            self._version += 1
+
+    def _reset_translation(self, index: int) -> None:
+        """清空指定下标条目的译文并重置修改标记"""
+        self._translated_count -= self._translated[index]
+        self._translations[index] = ""
+        self._display[index] = self._originals[index]
+        self._translated[index] = 0
+        self._changed[index] = 0
+        self._version += 1
+
     def export(self) -> str:
         """
         导出翻译后的文件内容
@@ -335,15 +910,35 @@ class ModDictionary:
         异常:
             ValueError: 如果文件格式未设置
         """
-        if not self.format:
+        if not self.format or not self._emit_fn:
+            raise ValueError("无法导出，文件格式未设置")
+        
+        # 上次导出后内容没有变化时直接返回缓存的结果
+        if self._export_cache is not None and self._export_cache[:2] == (self._version, self.format):
+            return self._export_cache[2]
+        
+        # 最终文本在设置译文时已确定，直接与按原始顺序排列的键配对生成输出内容
+        content = self._emit_fn(zip(self._index, self._display))
+        self._export_cache = (self._version, self.format, content)
+        return content
+
+    def export_to(self, file: IO[str]) -> None:
+        """
+        把翻译后的文件内容直接写入文件对象
+        
+        已有可用的导出缓存时直接写出缓存，否则逐条写出，不在内存中拼出完整文本
+        
+        参数:
+            file: 以文本模式打开的文件对象
+            
+        异常:
+            ValueError: 如果文件格式未设置
+        """
+        if not self.format or not self._emit_fn:
             raise ValueError("无法导出，文件格式未设置")
         
-        # 准备输出字典
-        output_dict = {}
-        for key in self.keys:
-            element = self.text_dictionary.get(key)
-            if element:
-                output_dict[key] = str(element)  # 使用__str__方法获取最终文本
+        if self._export_cache is not None and self._export_cache[:2] == (self._version, self.format):
+            file.write(self._export_cache[2])
+            return
         
-        # 生成输出内容
-        return LangFileParser.generate_output(output_dict, self.format, self.keys)
\ No newline at end of file
+        LangFileParser.get_writer(self.format)(file, zip(self._index, self._display))
@@ -1,19 +1,21 @@
 # main.py
 import sys
+from pathlib import Path
 from ui import MainWindow
 from PyQt5.QtWidgets import QApplication
-import os
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
-    # 加载样式表
-    try:
-        style_path = os.path.join(os.path.dirname(__file__), "style.qss")
-        with open(style_path, "r", encoding="utf-8") as f:
-            app.setStyleSheet(f.read())
-    except Exception as e:
-        print(f"样式加载失败: {e}")
-    
+    # 加载样式表，在创建窗口之前应用，所有控件创建时只需按样式表初始化一次
+    style_path = Path(__file__).resolve().parent / "style.qss"
+    if style_path.is_file():
+        try:
+            app.setStyleSheet(style_path.read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"样式加载失败: {e}")
+    else:
+        print(f"样式加载失败: 未找到样式文件 {style_path}")
+
     window = MainWindow()
     window.show()
-    sys.exit(app.exec_())
\ No newline at end of file
+    sys.exit(app.exec_())
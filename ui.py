@@ -1,4 +1,5 @@
-import os
+from functools import partial
+from pathlib import Path
 from PyQt5.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -7,9 +8,8 @@ from PyQt5.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QPushButton,
-    QListWidget,
-    QListWidgetItem,
-    QTextEdit,
+    QListView,
+    QPlainTextEdit,
     QFileDialog,
     QTabWidget,
     QComboBox,
@@ -17,10 +17,49 @@ from PyQt5.QtWidgets import (
     QSplitter,
     QLineEdit,
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QObject, QEvent
+from PyQt5.QtCore import (
+    Qt,
+    pyqtSignal,
+    QObject,
+    QThread,
+    QTimer,
+    QAbstractListModel,
+    QModelIndex,
+)
 from PyQt5.QtGui import QIcon
 from core import TextElement, ModDictionary, LangFormat  # 从核心模块导入类
 
+# 导出预览最多显示的字符数，超出部分只在保存的文件中
+PREVIEW_MAX_CHARS = 200_000
+
+class TranslationTextEdit(QPlainTextEdit):
+    """
+    译文输入框，在按键处理中直接响应快捷键：Enter保存，Shift+Enter插入换行
+    
+    属性:
+        submitRequested: 提交信号，按下Enter键时触发
+    """
+    
+    submitRequested = pyqtSignal()
+
+    def keyPressEvent(self, event):
+        """
+        处理按键事件
+        
+        参数:
+            event: 按键事件对象
+        """
+        if event.key() in (Qt.Key_Return, Qt.Key_Enter):
+            if event.modifiers() & Qt.ShiftModifier:
+                # Shift+Enter: 插入普通换行符，而不是默认的段内换行符
+                self.textCursor().insertText("\n")
+            else:
+                # Enter: 保存并进入下一个
+                self.submitRequested.emit()
+            return
+        super().keyPressEvent(event)
+
+
 class TranslationItem(QWidget):
     """
     单个翻译项的UI组件，用于显示原文和编辑译文
@@ -36,29 +75,30 @@ class TranslationItem(QWidget):
         初始化翻译项组件
         
         参数:
-            text_element: TextElement对象，包含翻译数据
+            text_element: TextElement对象，包含翻译数据，为None时稍后通过bind绑定
             parent: 父组件
         """
         super().__init__(parent)
-        self.text_element = text_element
-        self.init_ui()
+        self.text_element = None
+        self._build_widgets()
+        if text_element is not None:
+            self.bind(text_element)
 
-    def init_ui(self):
-        """设置UI布局和控件"""
+    def _build_widgets(self):
+        """创建UI布局和控件，只在构造时调用一次"""
         layout = QVBoxLayout(self)
 
         # 原文显示区域
         layout.addWidget(QLabel("原文:"))
-        self.original_text = QTextEdit()
-        self.original_text.setPlainText(self.text_element.original_text)
+        self.original_text = QPlainTextEdit()
         self.original_text.setReadOnly(True)  # 原文不可编辑
+        self.original_text.setUndoRedoEnabled(False)  # 只读内容不需要撤销记录
         layout.addWidget(self.original_text)
 
         # 译文编辑区域
         layout.addWidget(QLabel("译文:"))
-        self.translated_text = QTextEdit()
-        self.translated_text.setPlainText(self.text_element.translated_text)
-        self.translated_text.installEventFilter(self)  # 安装事件过滤器处理快捷键
+        self.translated_text = TranslationTextEdit()
+        self.translated_text.submitRequested.connect(self.save)  # Enter键保存
         layout.addWidget(self.translated_text)
 
         # 操作按钮
@@ -76,48 +116,172 @@ class TranslationItem(QWidget):
         
         layout.addLayout(buttons_layout)
 
-        # 设置初始焦点到译文输入框
-        self.translated_text.setFocus()
-
-    def eventFilter(self, obj, event):
+    def bind(self, text_element):
         """
-        事件过滤器，处理键盘快捷键
+        绑定要编辑的翻译项，复用已有控件而不是重新创建组件
         
         参数:
-            obj: 事件来源对象
-            event: 事件对象
-            
-        返回:
-            bool: True表示事件已处理，False表示未处理
-        """
-        # 处理译文输入框的按键事件
-        if obj == self.translated_text and event.type() == QEvent.KeyPress:
-            # Enter键保存并跳转下一项
-            if event.key() in (Qt.Key_Return, Qt.Key_Enter):
-                if event.modifiers() & Qt.ShiftModifier:
-                    # Shift+Enter: 插入换行
-                    cursor = self.translated_text.textCursor()
-                    cursor.insertText("\n")
-                    return True
-                else:
-                    # Enter: 保存并进入下一个
-                    self.save()
-                    return True
-        return super().eventFilter(obj, event)
+            text_element: TextElement对象，包含翻译数据
+        """
+        self.text_element = text_element
+        self.original_text.setPlainText(text_element.original_text)
+        self.translated_text.setPlainText(text_element.translated_text)
+        # 焦点推迟到下一轮事件循环再切换，避免在列表的选择信号处理中途抢走焦点
+        QTimer.singleShot(0, self.translated_text.setFocus)
 
     def reset(self):
         """重置译文内容"""
+        if self.text_element is None:
+            return
         self.translated_text.setPlainText("")
         self.text_element.reset()
         self.translated_text.setFocus()  # 重置后保持焦点在输入框
 
     def save(self):
         """保存译文并发射信号"""
+        if self.text_element is None:
+            return
         text = self.translated_text.toPlainText()
         self.text_element.set_translated_text(text)
         self.saved.emit(self.text_element.key, text)  # 发射保存信号
 
 
+class TranslationListModel(QAbstractListModel):
+    """
+    翻译条目列表的数据模型，直接读取模组字典，只为视图实际显示的行生成文字和图标
+    
+    每行对应模组字典中按原始顺序排列的一个条目，Qt.UserRole返回该行的键
+    """
+
+    def __init__(self, check_icon, empty_icon, parent=None):
+        """
+        初始化列表模型
+        
+        参数:
+            check_icon: 已翻译条目的图标(QIcon)
+            empty_icon: 未翻译条目的图标(QIcon)
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self._check_icon = check_icon
+        self._empty_icon = empty_icon
+        self._mod_dictionary = None
+        self._keys = []    # 行号 -> 键
+        self._labels = []  # 行号 -> 显示文字，首次显示该行时生成
+
+    def set_dictionary(self, mod_dictionary):
+        """
+        切换到新的模组字典并重置模型
+        
+        参数:
+            mod_dictionary: 模组翻译字典
+        """
+        self.beginResetModel()
+        self._mod_dictionary = mod_dictionary
+        self._keys = list(mod_dictionary.keys())
+        self._labels = [None] * len(self._keys)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        """返回条目数，列表模型没有子项"""
+        return 0 if parent.isValid() else len(self._keys)
+
+    def data(self, index, role=Qt.DisplayRole):
+        """
+        返回指定行的显示数据
+        
+        参数:
+            index: 行索引
+            role: 数据角色
+            
+        返回:
+            显示文字、状态图标或键，其他角色返回None
+        """
+        if not index.isValid():
+            return None
+        
+        row = index.row()
+        if role == Qt.DisplayRole:
+            # 原文加载后不会改变，显示文字生成一次后重复使用
+            label = self._labels[row]
+            if label is None:
+                # 超过30个字符的原文截断显示
+                text = self._mod_dictionary.get(self._keys[row]).original_text
+                label = self._labels[row] = f"{text[:27]}..." if len(text) > 30 else text
+            return label
+        
+        if role == Qt.DecorationRole:
+            # 行号即条目下标，直接读取翻译标记，绘制时不创建条目视图
+            translated = self._mod_dictionary.is_translated_at(row)
+            return self._check_icon if translated else self._empty_icon
+        if role == Qt.UserRole:
+            return self._keys[row]
+        return None
+
+    def row_of(self, key):
+        """
+        获取指定键所在的行号
+        
+        参数:
+            key: 翻译项的键
+            
+        返回:
+            行号，键不存在时为None
+        """
+        if self._mod_dictionary is None:
+            return None
+        return self._mod_dictionary.index_of(key)
+
+    def refresh_key(self, key):
+        """
+        通知视图重新读取指定条目的状态图标
+        
+        参数:
+            key: 翻译项的键
+        """
+        row = self.row_of(key)
+        if row is not None:
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.DecorationRole])
+
+    def refresh_all(self):
+        """批量修改后通知视图一次性重新读取所有条目的状态图标"""
+        if self._keys:
+            self.dataChanged.emit(self.index(0), self.index(len(self._keys) - 1), [Qt.DecorationRole])
+
+
+class FileTaskWorker(QObject):
+    """
+    在后台线程中执行文件读写任务的工作对象
+    
+    属性:
+        finished: 任务成功信号，参数为任务的返回值
+        failed: 任务失败信号，参数为错误信息
+    """
+    
+    finished = pyqtSignal(object)  # 信号参数: 任务返回值
+    failed = pyqtSignal(str)       # 信号参数: 错误信息
+
+    def __init__(self, task):
+        """
+        初始化工作对象
+        
+        参数:
+            task: 要在后台执行的无参数可调用对象
+        """
+        super().__init__()
+        self._task = task
+
+    def run(self):
+        """执行任务并发射结果信号"""
+        try:
+            result = self._task()
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            self.finished.emit(result)
+
+
 class MainWindow(QMainWindow):
     """主窗口类，包含翻译工具的所有UI组件"""
     
@@ -127,15 +291,23 @@ class MainWindow(QMainWindow):
         self.current_key = None     # 当前选中的翻译项键
         
         # 图标路径处理
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        self.icon_path = os.path.join(base_dir, "icons")
-        self.check_icon = os.path.join(self.icon_path, "check.png")  # 已翻译图标
-        self.empty_icon = os.path.join(self.icon_path, "empty.png")  # 未翻译图标
+        icon_dir = Path(__file__).resolve().parent / "icons"
+        check_icon = icon_dir / "check.png"  # 已翻译图标
+        empty_icon = icon_dir / "empty.png"  # 未翻译图标
         
         # 验证图标文件是否存在
-        if not all(os.path.exists(icon) for icon in [self.check_icon, self.empty_icon]):
+        if not (check_icon.exists() and empty_icon.exists()):
             print("警告: 图标文件缺失，请检查icons目录")
         
+        # 预先加载状态图标，所有列表项共用，之后不再访问图标文件
+        self._check_qicon = QIcon(str(check_icon))
+        self._empty_qicon = QIcon(str(empty_icon))
+        
+        # 正在执行的后台文件任务: (线程, 工作对象, 成功回调, 失败回调)
+        self._file_task = None
+        # 后台线程，任务结束后到线程发出finished信号之前仍保留引用，关闭窗口时等待其退出
+        self._file_thread = None
+        
         self.init_ui()  # 初始化UI
 
     def init_ui(self):
@@ -220,9 +392,20 @@ class MainWindow(QMainWindow):
         splitter = QSplitter(Qt.Horizontal)
         layout.addWidget(splitter)
         
-        # 左侧条目列表
-        self.entry_list = QListWidget()
-        self.entry_list.currentItemChanged.connect(self.update_translation_item)
+        # 左侧条目列表，由模型按需提供每行的文字和图标
+        self.entry_model = TranslationListModel(self._check_qicon, self._empty_qicon, self)
+        self.entry_list = QListView()
+        self.entry_list.setModel(self.entry_model)
+        # 所有条目行高相同，不必逐项计算尺寸；大量条目时分批布局，避免一次性阻塞界面
+        self.entry_list.setUniformItemSizes(True)
+        self.entry_list.setLayoutMode(QListView.Batched)
+        self.entry_list.setBatchSize(256)
+        # 在列表中连续切换条目（如按住方向键）时，停止切换50毫秒后才绑定编辑组件
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(50)
+        self._selection_timer.timeout.connect(self._apply_current_selection)
+        self.entry_list.selectionModel().currentChanged.connect(self._on_current_changed)
         splitter.addWidget(self.entry_list)
         
         # 右侧翻译面板
@@ -238,6 +421,12 @@ class MainWindow(QMainWindow):
         self.translation_container_layout = QVBoxLayout(self.translation_container)
         translation_layout.addWidget(self.translation_container)
         
+        # 翻译编辑组件只创建一次，切换条目时重新绑定数据
+        self.translation_item = TranslationItem(None)
+        self.translation_item.saved.connect(self.on_translation_saved)  # 连接保存信号
+        self.translation_item.hide()  # 选中条目前不显示
+        self.translation_container_layout.addWidget(self.translation_item)
+        
         # 导航按钮
         nav_buttons = QHBoxLayout()
         
@@ -284,7 +473,7 @@ class MainWindow(QMainWindow):
         
         # 预览区域
         layout.addWidget(QLabel("翻译结果预览:"))
-        self.preview_text = QTextEdit()
+        self.preview_text = QPlainTextEdit()
         self.preview_text.setReadOnly(True)  # 预览只读
         layout.addWidget(self.preview_text)
         
@@ -316,34 +505,64 @@ class MainWindow(QMainWindow):
         if not file_name:
             return  # 用户取消选择
 
-        try:
-            # 读取文件内容
-            with open(file_name, "r", encoding="utf-8") as file:
-                content = file.read()
-            
-            # 获取命名空间
-            namespace = self.namespace_edit.text().strip() or "mod"  # 默认为"mod"
-            
-            # 创建并加载模组字典
-            self.mod_dictionary = ModDictionary(namespace)
-            self.mod_dictionary.load_original_file(content)
-            
-            # 更新UI状态
-            self.original_status.setText(
-                f"原始文件: {os.path.basename(file_name)} ({self.mod_dictionary.format.value})"
-            )
-            self.open_translated_btn.setEnabled(True)
-            self.start_btn.setEnabled(True)
-            
-            # 显示成功消息
-            QMessageBox.information(
-                self,
-                "成功",
-                f"已加载原始文件，包含{len(self.mod_dictionary.keys)}个翻译条目",
-            )
+        # 获取命名空间
+        namespace = self.namespace_edit.text().strip() or "mod"  # 默认为"mod"
+        
+        # 在后台线程中读取并解析文件
+        self._run_file_task(
+            partial(self._load_original_dictionary, namespace, file_name),
+            self._on_original_loaded,
+            self._on_load_failed,
+        )
+
+    @staticmethod
+    def _load_original_dictionary(namespace, file_name):
+        """
+        创建并加载模组字典（在后台线程中执行）
+        
+        参数:
+            namespace: 模组命名空间
+            file_name: 原始语言文件路径
             
-        except Exception as e:
-            QMessageBox.critical(self, "错误", f"加载文件失败: {str(e)}")
+        返回:
+            tuple: (加载完成的模组字典, 文件路径)
+        """
+        mod_dictionary = ModDictionary(namespace)
+        # 传入路径以便直接从磁盘映射解析
+        mod_dictionary.load_original_file(Path(file_name))
+        return mod_dictionary, file_name
+
+    def _on_original_loaded(self, result):
+        """
+        原始文件加载完成后更新UI
+        
+        参数:
+            result: (模组字典, 文件路径)
+        """
+        self.mod_dictionary, file_name = result
+        
+        # 更新UI状态
+        self.original_status.setText(
+            f"原始文件: {Path(file_name).name} ({self.mod_dictionary.format.value})"
+        )
+        self.open_translated_btn.setEnabled(True)
+        self.start_btn.setEnabled(True)
+        
+        # 显示成功消息
+        QMessageBox.information(
+            self,
+            "成功",
+            f"已加载原始文件，包含{len(self.mod_dictionary.keys())}个翻译条目",
+        )
+
+    def _on_load_failed(self, message):
+        """
+        文件加载失败时显示错误
+        
+        参数:
+            message: 错误信息
+        """
+        QMessageBox.critical(self, "错误", f"加载文件失败: {message}")
 
     def open_translated_file(self):
         """打开已有的翻译文件并加载内容"""
@@ -364,30 +583,45 @@ class MainWindow(QMainWindow):
         if not file_name:
             return  # 用户取消选择
 
-        try:
-            # 读取文件内容
-            with open(file_name, "r", encoding="utf-8") as file:
-                content = file.read()
-            
-            # 加载翻译文件
-            self.mod_dictionary.load_translated_file(content)
-            
-            # 更新UI状态
-            self.translated_status.setText(f"翻译文件: {os.path.basename(file_name)}")
-            
-            # 计算并显示翻译进度
-            translated_count = sum(
-                1 for element in self.mod_dictionary.text_dictionary.values()
-                if element.is_translated
-            )
-            QMessageBox.information(
-                self,
-                "成功",
-                f"已加载翻译文件，已翻译{translated_count}/{len(self.mod_dictionary.keys)}个条目",
-            )
+        # 在后台线程中读取并解析文件
+        self._run_file_task(
+            partial(self._load_translated_file, self.mod_dictionary, file_name),
+            self._on_translated_loaded,
+            self._on_load_failed,
+        )
+
+    @staticmethod
+    def _load_translated_file(mod_dictionary, file_name):
+        """
+        读取翻译文件并加载到模组字典（在后台线程中执行）
+        
+        参数:
+            mod_dictionary: 模组字典
+            file_name: 翻译文件路径
             
-        except Exception as e:
-            QMessageBox.critical(self, "错误", f"加载文件失败: {str(e)}")
+        返回:
+            str: 文件路径
+        """
+        # 传入路径，由核心模块通过内存映射读取，不先把整个文件读成字符串
+        mod_dictionary.load_translated_file(Path(file_name))
+        return file_name
+
+    def _on_translated_loaded(self, file_name):
+        """
+        翻译文件加载完成后更新UI
+        
+        参数:
+            file_name: 翻译文件路径
+        """
+        # 更新UI状态
+        self.translated_status.setText(f"翻译文件: {Path(file_name).name}")
+        
+        # 显示翻译进度
+        QMessageBox.information(
+            self,
+            "成功",
+            f"已加载翻译文件，已翻译{self.mod_dictionary.translated_count}/{len(self.mod_dictionary.keys())}个条目",
+        )
 
     def start_translation(self):
         """开始翻译，初始化翻译界面"""
@@ -395,35 +629,15 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "警告", "请先加载原始语言文件")
             return
 
-        # 清空条目列表
-        self.entry_list.clear()
-        
-        # 填充条目列表
-        for key in self.mod_dictionary.keys:
-            element = self.mod_dictionary.text_dictionary[key]
-            
-            # 创建列表项
-            item = QListWidgetItem()
-            item.setText(f"{element.original_text[:30]}...")  # 显示前30个字符
-            item.setData(Qt.UserRole, key)  # 存储键值
-            
-            # 设置状态图标
-            try:
-                if element.is_translated:
-                    item.setIcon(QIcon(self.check_icon))  # 已翻译图标
-                else:
-                    item.setIcon(QIcon(self.empty_icon))  # 未翻译图标
-            except:
-                pass  # 图标加载失败时忽略
-            
-            self.entry_list.addItem(item)
+        # 条目列表直接显示模组字典的内容，不再逐项创建列表项
+        self.entry_model.set_dictionary(self.mod_dictionary)
         
         # 更新翻译进度
         self.update_translation_progress()
         
         # 默认选择第一项
-        if self.entry_list.count() > 0:
-            self.entry_list.setCurrentRow(0)
+        if self.entry_model.rowCount() > 0:
+            self._select_row(0)
         
         # 启用翻译选项卡并切换
         self.tabs.setTabEnabled(1, True)
@@ -434,33 +648,21 @@ class MainWindow(QMainWindow):
         更新当前翻译项目显示
         
         参数:
-            current: 当前选中的列表项
-            previous: 之前选中的列表项
+            current: 当前选中行的索引(QModelIndex)
+            previous: 之前选中行的索引
         """
-        if not current:
+        if not current.isValid():
             return  # 没有选中项时返回
         
-        # 清除现有翻译组件
-        for i in reversed(range(self.translation_container_layout.count())):
-            widget = self.translation_container_layout.itemAt(i).widget()
-            if widget:
-                widget.deleteLater()
-        
         # 获取当前翻译项数据
         key = current.data(Qt.UserRole)
         self.current_key = key
         
-        if key in self.mod_dictionary.text_dictionary:
-            element = self.mod_dictionary.text_dictionary[key]
-            
-            # 创建新翻译组件
-            translation_item = TranslationItem(element)
-            translation_item.saved.connect(self.on_translation_saved)  # 连接保存信号
-            self.translation_container_layout.addWidget(translation_item)
-            
-            # 确保新组件获得焦点
-            QApplication.processEvents()
-            translation_item.translated_text.setFocus()
+        element = self.mod_dictionary.get(key)
+        if element:
+            # 复用翻译组件，只替换绑定的翻译项
+            self.translation_item.show()
+            self.translation_item.bind(element)
 
     def on_translation_saved(self, key, text):
         """
@@ -473,84 +675,97 @@ class MainWindow(QMainWindow):
         if not key or not self.mod_dictionary:
             return
         
-        # 更新翻译项状态
-        element = self.mod_dictionary.text_dictionary[key]
-        element.set_translated_text(text)
+        # 更新翻译项状态，按键直接写入，不必先取出条目视图
+        self.mod_dictionary.set_translated_text(key, text)
         
         # 更新列表项图标
-        for i in range(self.entry_list.count()):
-            item = self.entry_list.item(i)
-            if item.data(Qt.UserRole) == key:
-                try:
-                    if element.is_translated:
-                        item.setIcon(QIcon(self.check_icon))  # 已翻译图标
-                    else:
-                        item.setIcon(QIcon(self.empty_icon))  # 未翻译图标
-                except:
-                    pass  # 图标加载失败时忽略
-                break
+        self.entry_model.refresh_key(key)
         
         # 更新进度并跳转下一项
         self.update_translation_progress()
         self.go_to_next()
 
+    def _current_row(self):
+        """
+        获取条目列表当前选中的行号
+        
+        返回:
+            int: 行号，没有选中项时为-1
+        """
+        return self.entry_list.currentIndex().row()
+
+    def _select_row(self, row):
+        """
+        选中条目列表的指定行，并立即显示该条目
+        
+        参数:
+            row: 行号
+        """
+        self.entry_list.setCurrentIndex(self.entry_model.index(row))
+        self._apply_current_selection()
+
+    def _on_current_changed(self, current, previous):
+        """
+        列表选中项变化时重新开始计时，计时结束后才显示选中的条目
+        
+        参数:
+            current: 当前选中行的索引(QModelIndex)
+            previous: 之前选中行的索引
+        """
+        self._selection_timer.start()
+
+    def _apply_current_selection(self):
+        """把编辑组件绑定到列表当前选中的条目，取消尚未执行的延迟绑定"""
+        self._selection_timer.stop()
+        self.update_translation_item(self.entry_list.currentIndex(), None)
+
     def update_translation_progress(self):
         """更新翻译进度显示"""
         if not self.mod_dictionary:
             return
         
-        total = len(self.mod_dictionary.keys)
-        translated = sum(
-            1 for element in self.mod_dictionary.text_dictionary.values()
-            if element.is_translated
-        )
+        total = len(self.mod_dictionary.keys())
+        translated = self.mod_dictionary.translated_count
         
         self.progress_label.setText(f"翻译进度: {translated} / {total}")
 
     def go_to_previous(self):
         """跳转到前一个翻译条目"""
-        if self.entry_list.count() == 0:
+        if self.entry_model.rowCount() == 0:
             return
         
-        current_row = self.entry_list.currentRow()
+        current_row = self._current_row()
         if current_row > 0:
-            self.entry_list.setCurrentRow(current_row - 1)
+            self._select_row(current_row - 1)
 
     def go_to_next(self):
         """跳转到下一个翻译条目"""
-        if self.entry_list.count() == 0:
+        row_count = self.entry_model.rowCount()
+        if row_count == 0:
             return
         
-        current_row = self.entry_list.currentRow()
-        if current_row < self.entry_list.count() - 1:
-            self.entry_list.setCurrentRow(current_row + 1)
+        current_row = self._current_row()
+        if current_row < row_count - 1:
+            self._select_row(current_row + 1)
 
     def skip_to_next_untranslated(self):
         """跳转到下一个未翻译条目"""
-        if not self.mod_dictionary or self.entry_list.count() == 0:
+        row_count = self.entry_model.rowCount()
+        if not self.mod_dictionary or row_count == 0:
             return
         
-        current_row = self.entry_list.currentRow()
+        current_row = self._current_row()
         
-        # 从当前位置向后查找未翻译条目
-        for i in range(current_row + 1, self.entry_list.count()):
-            item = self.entry_list.item(i)
-            key = item.data(Qt.UserRole)
-            element = self.mod_dictionary.text_dictionary[key]
-            
-            if not element.is_translated:
-                self.entry_list.setCurrentRow(i)
-                return
+        # 从当前位置向后查找未翻译条目，列表行号与字典中的条目下标一致
+        row = self.mod_dictionary.find_untranslated(current_row + 1)
         
         # 如果没找到，从头开始查找
-        for i in range(0, current_row):
-            item = self.entry_list.item(i)
-            key = item.data(Qt.UserRole)
-            element = self.mod_dictionary.text_dictionary[key]
-            
-            if not element.is_translated:
-                self.entry_list.setCurrentRow(i)
-                return
+        if row is None and current_row > 0:
+            row = self.mod_dictionary.find_untranslated(0, current_row)
+        
+        if row is not None:
+            self._select_row(row)
+            return
         
         # 所有条目都已翻译
         QMessageBox.information(self, "信息", "所有条目已翻译完成")
@@ -560,27 +775,12 @@ class MainWindow(QMainWindow):
         if not self.mod_dictionary:
             return
         
-        count = 0
-        for key, element in self.mod_dictionary.text_dictionary.items():
-            if element.is_translated and element.original_text == element.translated_text:
-                element.reset()  # 重置翻译
-                count += 1
-                
-                # 更新列表项图标
-                for i in range(self.entry_list.count()):
-                    item = self.entry_list.item(i)
-                    if item.data(Qt.UserRole) == key:
-                        try:
-                            item.setIcon(QIcon(self.empty_icon))  # 设置为未翻译图标
-                        except:
-                            pass
-                        break
-        
-        # 更新UI
+        count = self.mod_dictionary.clear_duplicate_translations()
+        
+        # 更新UI，列表图标统一刷新一次
+        self.entry_model.refresh_all()
         self.update_translation_progress()
-        current = self.entry_list.currentItem()
-        if current:
-            self.update_translation_item(current, None)
+        self.update_translation_item(self.entry_list.currentIndex(), None)
         
         QMessageBox.information(self, "完成", f"已清除{count}个重复译文")
 
@@ -589,27 +789,12 @@ class MainWindow(QMainWindow):
         if not self.mod_dictionary:
             return
         
-        count = 0
-        for key, element in self.mod_dictionary.text_dictionary.items():
-            if not element.is_translated:
-                element.set_translated_text(element.original_text)
-                count += 1
-                
-                # 更新列表项图标
-                for i in range(self.entry_list.count()):
-                    item = self.entry_list.item(i)
-                    if item.data(Qt.UserRole) == key:
-                        try:
-                            item.setIcon(QIcon(self.check_icon))  # 设置为已翻译图标
-                        except:
-                            pass
-                        break
-        
-        # 更新UI
+        count = self.mod_dictionary.fill_empty_translations()
+        
+        # 更新UI，列表图标统一刷新一次
+        self.entry_model.refresh_all()
         self.update_translation_progress()
-        current = self.entry_list.currentItem()
-        if current:
-            self.update_translation_item(current, None)
+        self.update_translation_item(self.entry_list.currentIndex(), None)
         
         QMessageBox.information(self, "完成", f"已填充{count}个空白译文")
 
@@ -618,8 +803,11 @@ class MainWindow(QMainWindow):
         if not self.mod_dictionary:
             return
         
-        # 生成预览内容
+        # 生成预览内容，内容过长时只显示开头部分（在最后一个完整行处截断）
         preview = self.mod_dictionary.export()
+        if len(preview) > PREVIEW_MAX_CHARS:
+            cut = preview.rfind("\n", 0, PREVIEW_MAX_CHARS)
+            preview = preview[:cut if cut > 0 else PREVIEW_MAX_CHARS] + "\n...（预览已截断，保存的文件包含全部内容）"
         self.preview_text.setPlainText(preview)
         
         # 启用导出选项卡并切换
@@ -647,13 +835,119 @@ class MainWindow(QMainWindow):
         if not file_name:
             return  # 用户取消保存
 
-        try:
-            # 导出并保存文件
-            content = self.mod_dictionary.export()
-            with open(file_name, "w", encoding="utf-8") as file:
-                file.write(content)
-            
-            QMessageBox.information(self, "成功", "翻译文件保存成功")
-            
-        except Exception as e:
-            QMessageBox.critical(self, "错误", f"保存文件失败: {str(e)}")
\ No newline at end of file
+        # 导出内容直接逐条写入文件，在后台线程中进行
+        self._run_file_task(
+            partial(self._write_file, self.mod_dictionary, file_name),
+            self._on_saved,
+            self._on_save_failed,
+        )
+
+    @staticmethod
+    def _write_file(mod_dictionary, file_name):
+        """
+        把翻译结果写入文件（在后台线程中执行）
+        
+        参数:
+            mod_dictionary: 要导出的模组翻译字典
+            file_name: 文件路径
+        """
+        with open(file_name, "w", encoding="utf-8") as file:
+            mod_dictionary.export_to(file)
+
+    def _on_saved(self, _):
+        """文件保存完成后提示用户"""
+        QMessageBox.information(self, "成功", "翻译文件保存成功")
+
+    def _on_save_failed(self, message):
+        """
+        文件保存失败时显示错误
+        
+        参数:
+            message: 错误信息
+        """
+        QMessageBox.critical(self, "错误", f"保存文件失败: {message}")
+
+    def _run_file_task(self, task, on_finished, on_failed):
+        """
+        在后台线程中执行文件任务，期间禁用界面并显示忙碌光标
+        
+        参数:
+            task: 要在后台执行的无参数可调用对象
+            on_finished: 任务成功时在主线程调用的回调，参数为任务返回值
+            on_failed: 任务失败时在主线程调用的回调，参数为错误信息
+        """
+        if self._file_task is not None:
+            return  # 已有任务在执行
+        if self._file_thread is not None:
+            # 上一个任务已完成，但线程的退出请求可能还在主线程队列中，先直接请求退出再等待
+            self._file_thread.quit()
+            self._file_thread.wait()
+        
+        thread = QThread(self)
+        worker = FileTaskWorker(task)
+        worker.moveToThread(thread)
+        
+        # 工作对象在后台线程中运行，结果信号经队列回到主线程处理
+        thread.started.connect(worker.run)
+        worker.finished.connect(self._on_file_task_finished)
+        worker.failed.connect(self._on_file_task_failed)
+        worker.finished.connect(thread.quit)
+        worker.failed.connect(thread.quit)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        thread.finished.connect(self._on_file_thread_finished)
+        
+        self._file_task = (thread, worker, on_finished, on_failed)
+        self._file_thread = thread
+        self.tabs.setEnabled(False)
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        thread.start()
+
+    def _end_file_task(self):
+        """
+        结束当前文件任务，恢复界面状态
+        
+        返回:
+            tuple: (成功回调, 失败回调)
+        """
+        _, _, on_finished, on_failed = self._file_task
+        self._file_task = None
+        QApplication.restoreOverrideCursor()
+        self.tabs.setEnabled(True)
+        return on_finished, on_failed
+
+    def _on_file_task_finished(self, result):
+        """后台文件任务成功完成"""
+        if self._file_task is None:
+            return  # 窗口已关闭，不再处理结果
+        on_finished, _ = self._end_file_task()
+        on_finished(result)
+
+    def _on_file_task_failed(self, message):
+        """后台文件任务执行失败"""
+        if self._file_task is None:
+            return  # 窗口已关闭，不再处理结果
+        _, on_failed = self._end_file_task()
+        on_failed(message)
+
+    def _on_file_thread_finished(self):
+        """后台线程已退出，释放对它的引用"""
+        if self.sender() is self._file_thread:
+            self._file_thread = None
+
+    def closeEvent(self, event):
+        """
+        关闭窗口前等待后台文件任务结束
+        
+        后台线程属于窗口，运行中被销毁会使程序异常退出，正在保存的文件也可能只写入一部分
+        
+        参数:
+            event: 关闭事件
+        """
+        if self._file_thread is not None:
+            self._file_thread.quit()
+            self._file_thread.wait()
+            self._file_thread = None
+        if self._file_task is not None:
+            self._end_file_task()
+        super().closeEvent(event)